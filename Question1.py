@@ -1,63 +1,150 @@
 
-from dataclasses import dataclass
-from typing import Any, List, Optional, Tuple
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
 from time import perf_counter
 import random
 import string
+import sys
+
+try:
+    import numpy as np  # optional: only used for the vectorized array baseline
+except ImportError:
+    np = None
 
 # ========== 1) DATA STRUCTURES ==========
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     sku: str           # unique key (e.g., "SKU-0001")
     name: str
     category: str
     price: float
     stock: int
+    # hash(sku), computed once in __post_init__; only valid while sku is never reassigned
+    _sku_hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Interned SKUs let hash-table hits compare by identity instead of character by character
+        self.sku = sys.intern(self.sku)
+        # SKUs never change, so their hash can be handed to the table directly
+        self._sku_hash = hash(self.sku)
 
     def __str__(self) -> str:
         return f"[{self.sku}] {self.name} | {self.category} | RM{self.price:.2f} | stock: {self.stock}"
 
-class HashTableSeparateChaining:
+def _is_prime(n: int) -> bool:
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    i = 3
+    while i * i <= n:
+        if n % i == 0:
+            return False
+        i += 2
+    return True
+
+def _next_prime(n: int) -> int:
+    """Smallest prime >= n (trial division is plenty for table sizes)."""
+    while not _is_prime(n):
+        n += 1
+    return n
+
+class HashTableRobinHood:
     """
-    Hash table keyed by strings (e.g., SKU), using separate chaining via lists.
+    Hash table keyed by strings (e.g., SKU), using open addressing with Robin Hood probing.
+    Hashes, keys, values and probe distances live in flat parallel lists, so there are no
+    per-entry tuples or bucket lists to chase on a lookup.
     """
+    MAX_LOAD_FACTOR = 0.7
+
     def __init__(self, capacity: int = 53) -> None:
         # Capacity should be a positive integer; prime-ish sizes reduce clustering a bit.
         self._capacity = max(5, capacity)
-        self._buckets: List[List[Tuple[str, Any]]] = [[] for _ in range(self._capacity)]
+        # hash(key) is cached per slot: resizing never rehashes and a hash mismatch
+        # rejects a slot without a full string comparison.
+        self._hashes: List[int] = [0] * self._capacity
+        self._keys: List[Optional[str]] = [None] * self._capacity
+        self._vals: List[Any] = [None] * self._capacity
+        # Distance from initial bucket (DIB) per slot; -1 marks an empty slot.
+        self._dib: List[int] = [-1] * self._capacity
         self._size = 0
 
-    def _index(self, key: str) -> int:
-        return hash(key) % self._capacity
-
     def _should_resize(self) -> bool:
-        # Simple policy: resize when load factor > 0.75
-        return self.load_factor() > 0.75
+        # Open addressing degrades quickly past ~0.7, so grow earlier than chaining would.
+        return self.load_factor() > self.MAX_LOAD_FACTOR
 
     def load_factor(self) -> float:
         return self._size / self._capacity
 
     def _resize(self, new_capacity: int) -> None:
-        old_items = [(k, v) for bucket in self._buckets for (k, v) in bucket]
-        self._capacity = max(5, new_capacity)
-        self._buckets = [[] for _ in range(self._capacity)]
-        self._size = 0
-        for k, v in old_items:
-            self.insert(k, v, allow_update=True)
+        old_hashes, old_keys, old_vals, old_dib = self._hashes, self._keys, self._vals, self._dib
+        cap = _next_prime(max(5, new_capacity))
+        hashes: List[int] = [0] * cap
+        keys: List[Optional[str]] = [None] * cap
+        vals: List[Any] = [None] * cap
+        dib: List[int] = [-1] * cap
+        # Walk the old slots in place and Robin Hood each entry straight into the new arrays
+        # (same loop as _place, inlined): no snapshot list, no insert()/hash() per item.
+        for i, d in enumerate(old_dib):
+            if d < 0:
+                continue
+            h, key, value = old_hashes[i], old_keys[i], old_vals[i]
+            idx = h % cap
+            dist = 0
+            while dib[idx] >= 0:
+                if dib[idx] < dist:
+                    h, hashes[idx] = hashes[idx], h
+                    key, keys[idx] = keys[idx], key
+                    value, vals[idx] = vals[idx], value
+                    dist, dib[idx] = dib[idx], dist
+                dist += 1
+                idx += 1
+                if idx == cap:
+                    idx = 0
+            hashes[idx], keys[idx], vals[idx], dib[idx] = h, key, value, dist
+        self._capacity = cap
+        self._hashes, self._keys, self._vals, self._dib = hashes, keys, vals, dib
+
+    def reserve(self, n_expected: int) -> None:
+        """Grow once so n_expected entries fit without any intermediate resizes."""
+        needed = _next_prime(int(n_expected / self.MAX_LOAD_FACTOR) + 1)
+        if needed > self._capacity:
+            self._resize(needed)
+
+    def _find(self, key: str, h: int) -> int:
+        """Return the slot holding key (whose hash is h), or -1 if absent."""
+        hashes, keys, dib, cap = self._hashes, self._keys, self._dib, self._capacity
+        idx = h % cap
+        dist = 0
+        # A slot whose DIB is smaller than our probe distance (or empty) proves the key
+        # is not in the table: Robin Hood would have placed it there instead.
+        while dib[idx] >= dist:
+            if hashes[idx] == h and keys[idx] == key:
+                return idx
+            dist += 1
+            idx += 1
+            if idx == cap:
+                idx = 0
+        return -1
 
     def insert(self, key: str, value: Any, allow_update: bool = True) -> bool:
-        idx = self._index(key)
-        bucket = self._buckets[idx]
-
-        for i, (k, _) in enumerate(bucket):
-            if k == key:
-                if allow_update:
-                    bucket[i] = (key, value)
-                    return True
-                else:
-                    return False  # key exists and updates not allowed
-        bucket.append((key, value))
+        key = sys.intern(key)  # stored keys are interned so equal lookups short-circuit on identity
+        return self.insert_known_hash(key, hash(key), value, allow_update)
+
+    def insert_known_hash(self, key: str, key_hash: int, value: Any, allow_update: bool = True) -> bool:
+        """insert() for callers that already hold hash(key) and an interned key (e.g. a Product's
+        sku and _sku_hash); neither is recomputed here."""
+        slot = self._find(key, key_hash)
+        if slot >= 0:
+            if allow_update:
+                self._vals[slot] = value
+                return True
+            return False  # key exists and updates not allowed
+
+        self._place(key_hash, key, value)
         self._size += 1
 
         if self._should_resize():
@@ -65,42 +152,79 @@ class HashTableSeparateChaining:
 
         return True
 
+    def _place(self, h: int, key: str, value: Any) -> None:
+        """Robin Hood insertion of a key known to be absent; does not touch _size."""
+        hashes, keys, vals, dib, cap = self._hashes, self._keys, self._vals, self._dib, self._capacity
+        idx = h % cap
+        dist = 0
+        while dib[idx] >= 0:
+            # Steal the slot from a "richer" entry (closer to its home) and carry it onwards.
+            if dib[idx] < dist:
+                h, hashes[idx] = hashes[idx], h
+                key, keys[idx] = keys[idx], key
+                value, vals[idx] = vals[idx], value
+                dist, dib[idx] = dib[idx], dist
+            dist += 1
+            idx += 1
+            if idx == cap:
+                idx = 0
+        hashes[idx], keys[idx], vals[idx], dib[idx] = h, key, value, dist
+
     def get(self, key: str) -> Optional[Any]:
-        idx = self._index(key)
-        for (k, v) in self._buckets[idx]:
-            if k == key:
-                return v
-        return None
+        slot = self._find(key, hash(key))
+        return self._vals[slot] if slot >= 0 else None
 
     def delete(self, key: str) -> bool:
-        idx = self._index(key)
-        bucket = self._buckets[idx]
-        for i, (k, _) in enumerate(bucket):
-            if k == key:
-                bucket.pop(i)
-                self._size -= 1
-                return True
-        return False
+        idx = self._find(key, hash(key))
+        if idx < 0:
+            return False
+        hashes, keys, vals, dib, cap = self._hashes, self._keys, self._vals, self._dib, self._capacity
+        # Backward-shift deletion: pull following displaced entries one slot closer to home,
+        # so no tombstones are needed.
+        nxt = idx + 1 if idx + 1 < cap else 0
+        while dib[nxt] > 0:
+            hashes[idx], keys[idx], vals[idx] = hashes[nxt], keys[nxt], vals[nxt]
+            dib[idx] = dib[nxt] - 1
+            idx = nxt
+            nxt = idx + 1 if idx + 1 < cap else 0
+        keys[idx], vals[idx], dib[idx] = None, None, -1
+        self._size -= 1
+        return True
 
     def contains(self, key: str) -> bool:
-        return self.get(key) is not None
+        return self._find(key, hash(key)) >= 0
 
     def __len__(self) -> int:
         return self._size
 
     def items(self):
-        for bucket in self._buckets:
-            for k, v in bucket:
+        for k, v, d in zip(self._keys, self._vals, self._dib):
+            if d >= 0:
                 yield (k, v)
 
+# Optional native build of the same table (see _hashtable.pyx); same API, much faster get().
+try:
+    from _hashtable import CHashTable as FastHashTable
+except ImportError:
+    FastHashTable = HashTableRobinHood
+
+_by_sku = attrgetter("sku")
+
 # ========== 2) LOCAL STORAGE (BABY SHOP) + 3) CLI INVENTORY ==========
 
 class InventorySystem:
-    def __init__(self, capacity: int = 53) -> None:
-        # Hash table as primary store
-        self.table = HashTableSeparateChaining(capacity=capacity)
+    def __init__(self, store: Optional[Dict[str, Product]] = None) -> None:
+        # Built-in dict as primary store (open addressing done in C); the hand-written
+        # hash table above is only built for the comparison in benchmark_search.
+        self.table: Dict[str, Product] = {} if store is None else store
         # One-dimensional array (list) for performance comparison
         self.array: List[Product] = []
+        # sku -> position in self.array, so deletes don't need a linear scan
+        self._array_index: Dict[str, int] = {}
+        for p in self.table.values():
+            self._array_append(p)
+        # Products kept in SKU order as they come and go, so listing never has to sort
+        self._sorted: List[Product] = sorted(self.table.values(), key=_by_sku)
         # Preload some sample baby shop products
         self._seed_data()
 
@@ -118,15 +242,20 @@ class InventorySystem:
             Product("SKU-0010", "Cotton Onesies (3-pack)", "Clothing", 39.90, 80),
         ]
         for p in samples:
-            self.table.insert(p.sku, p)
-            self.array.append(p)
+            self.insert_product(p)
+
+    def _array_append(self, p: Product) -> None:
+        self._array_index[p.sku] = len(self.array)
+        self.array.append(p)
 
     # -------- CRUD --------
     def insert_product(self, p: Product) -> bool:
-        ok = self.table.insert(p.sku, p, allow_update=False)
-        if ok:
-            self.array.append(p)
-        return ok
+        if p.sku in self.table:
+            return False
+        self.table[p.sku] = p
+        self._array_append(p)
+        insort(self._sorted, p, key=_by_sku)
+        return True
 
     def search_by_sku(self, sku: str) -> Optional[Product]:
         return self.table.get(sku)
@@ -139,24 +268,24 @@ class InventorySystem:
         if category is not None: p.category = category
         if price is not None: p.price = float(price)
         if stock is not None: p.stock = int(stock)
-        # Hash table already holds the same object; array list needs no change if we keep identity
+        # The store already holds the same object; array list needs no change if we keep identity
         return True
 
     def delete_product(self, sku: str) -> bool:
-        p = self.table.get(sku)
-        if not p:
+        if self.table.pop(sku, None) is None:
             return False
-        self.table.delete(sku)
-        # Remove from array (linear scan)
-        for i, item in enumerate(self.array):
-            if item.sku == sku:
-                self.array.pop(i)
-                break
+        # Remove from array in O(1): move the last item into the freed slot
+        i = self._array_index.pop(sku)
+        last = self.array.pop()
+        if i < len(self.array):
+            self.array[i] = last
+            self._array_index[last.sku] = i
+        del self._sorted[bisect_left(self._sorted, sku, key=_by_sku)]
         return True
 
     def list_products(self) -> List[Product]:
-        # Items in hash table have no inherent order; show a nicely sorted view by SKU.
-        return sorted((v for _, v in self.table.items()), key=lambda p: p.sku)
+        # The store has no useful order; return a copy of the incrementally sorted view by SKU.
+        return list(self._sorted)
 
     # -------- Display helpers --------
     @staticmethod
@@ -172,39 +301,58 @@ class InventorySystem:
         print("-" * 85)
 
     # -------- 4) PERFORMANCE COMPARISON --------
-    def benchmark_search(self, n_extra: int = 20000, trials: int = 2000) -> None:
+    def benchmark_search(self, n_extra: int = 20000, trials: int = 2000, seed: Optional[int] = 42) -> None:
         """
         Insert additional random items (same items into both structures),
-        then randomly look up keys and time hash vs array (linear scan).
+        then randomly look up keys and time hash vs array (linear scan, in Python and,
+        if NumPy is installed, vectorized). A fixed seed keeps runs comparable; pass None for fresh data.
         """
+        # Private generator: seeding it leaves the process-wide random module alone. Mix in the
+        # current size so a second run in the same session still adds new SKUs.
+        rng = random.Random(None if seed is None else seed + len(self.array))
+
         # Generate unique random SKUs and insert
         new_items: List[Product] = []
         for _ in range(n_extra):
-            sku = "SKU-" + "".join(random.choices(string.ascii_uppercase + string.digits, k=8))
-            p = Product(sku, "Sample Item", "Misc", round(random.uniform(5, 500), 2), random.randint(0, 500))
-            if self.table.contains(sku):
+            sku = "SKU-" + "".join(rng.choices(string.ascii_uppercase + string.digits, k=8))
+            p = Product(sku, "Sample Item", "Misc", round(rng.uniform(5, 500), 2), rng.randint(0, 500))
+            if sku in self.table:
                 continue  # extremely unlikely collision, but just in case
-            self.table.insert(sku, p, allow_update=False)
-            self.array.append(p)
+            self.table[sku] = p
+            self._array_append(p)
             new_items.append(p)
+        # Merge the whole batch into the sorted view at once rather than 20k single inserts
+        self._sorted += new_items
+        self._sorted.sort(key=_by_sku)
+
+        # Load the same records into the hand-written hash table, sized once for the whole
+        # batch instead of rehashing repeatedly while it grows
+        table = FastHashTable()
+        table.reserve(len(self.array))
+        for p in self.array:
+            table.insert_known_hash(p.sku, p._sku_hash, p, allow_update=False)
 
         # Build a pool of existing keys for fair random lookups (half hits, half misses)
         existing_keys = [p.sku for p in self.array]
-        miss_keys = ["MISS-" + "".join(random.choices(string.ascii_uppercase + string.digits, k=8))
+        miss_keys = ["MISS-" + "".join(rng.choices(string.ascii_uppercase + string.digits, k=8))
                      for _ in range(trials // 2)]
-        queries = []
-        for _ in range(trials):
-            if random.random() < 0.5:
-                queries.append(random.choice(existing_keys))  # hit
-            else:
-                queries.append(random.choice(miss_keys))      # miss
+        queries = rng.choices(existing_keys, k=trials // 2)            # hits
+        queries += rng.choices(miss_keys, k=trials - trials // 2)      # misses
+        rng.shuffle(queries)
 
         # Time hash table lookups
         t0 = perf_counter()
         for q in queries:
-            _ = self.table.get(q)
+            _ = table.get(q)
         t_hash = perf_counter() - t0
 
+        # Time the built-in dict that backs the inventory
+        store = self.table
+        t3 = perf_counter()
+        for q in queries:
+            _ = store.get(q)
+        t_dict = perf_counter() - t3
+
         # Time array linear search
         def linear_search(sku: str) -> Optional[Product]:
             for p in self.array:
@@ -217,19 +365,49 @@ class InventorySystem:
             _ = linear_search(q)
         t_array = perf_counter() - t1
 
+        # Same linear scan, but the compare loop runs in C over a packed SKU array
+        t_numpy = t_batch = None
+        if np is not None:
+            sku_arr = np.array([p.sku.encode() for p in self.array])
+
+            def linear_search_np(sku: str) -> Optional[Product]:
+                idx = np.flatnonzero(sku_arr == sku.encode())
+                return self.array[idx[0]] if idx.size else None
+
+            t2 = perf_counter()
+            for q in queries:
+                _ = linear_search_np(q)
+            t_numpy = perf_counter() - t2
+
+            # Answer every query in one vectorized pass (membership only, no Product returned)
+            q_arr = np.array([q.encode() for q in queries])
+            t4 = perf_counter()
+            _ = np.isin(q_arr, sku_arr)
+            t_batch = perf_counter() - t4
+
         print("\n=== Search Performance Comparison ===")
         print(f"Records in table/array: {len(self.array):,}")
-        print(f"Queries: {trials:,} (≈50% hits / 50% misses)")
+        print(f"Queries: {trials:,} (50% hits / 50% misses)")
         print(f"Hash table total time : {t_hash:.6f} s   (~{(t_hash/trials)*1e6:.2f} µs/query)")
+        print(f"Built-in dict time    : {t_dict:.6f} s   (~{(t_dict/trials)*1e6:.2f} µs/query)")
         print(f"Array (linear) time   : {t_array:.6f} s   (~{(t_array/trials)*1e6:.2f} µs/query)")
+        if t_numpy is not None:
+            print(f"Array (NumPy) time    : {t_numpy:.6f} s   (~{(t_numpy/trials)*1e6:.2f} µs/query)")
+            print(f"Array (NumPy batch)   : {t_batch:.6f} s   (~{(t_batch/trials)*1e6:.2f} µs/query, all queries in one np.isin)")
         speedup = (t_array / t_hash) if t_hash > 0 else float('inf')
         print(f"Speedup (array / hash): {speedup:.2f}× (higher is better)")
+        if t_numpy is not None:
+            speedup_np = (t_numpy / t_hash) if t_hash > 0 else float('inf')
+            print(f"Speedup (NumPy / hash): {speedup_np:.2f}× (interpreter overhead removed; the rest is O(n) vs O(1))")
 
         # Simple explanation
         print("\nWhy the difference?")
         print("- Hash table average lookup is O(1): it jumps straight to a bucket via hash(key).")
         print("- Array lookup is O(n): it scans item by item until it finds a match (or reaches the end).")
-        print("- Separate chaining keeps collisions local to small bucket lists, so lookups stay fast at typical load factors.")
+        print("- Robin Hood probing keeps probe sequences short and contiguous, so lookups stay fast at typical load factors.")
+        print("- Python's dict uses the same open-addressing idea, implemented in C, which is why the inventory uses it.")
+        if t_batch is not None:
+            print("- The NumPy batch sorts once and answers all queries together, so data layout alone closes much of the gap for bulk lookups.")
 
     # -------- CLI --------
     def run(self) -> None:
@@ -255,7 +433,7 @@ class InventorySystem:
                 if not sku:
                     print("SKU cannot be empty.")
                     continue
-                if self.table.contains(sku):
+                if sku in self.table:
                     print("SKU already exists.")
                     continue
                 name = input("Name: ").strip()
@@ -280,7 +458,7 @@ class InventorySystem:
 
             elif choice == "4":
                 sku = input("Enter SKU to edit: ").strip()
-                if not self.table.contains(sku):
+                if sku not in self.table:
                     print("SKU not found.")
                     continue
                 print("Leave fields empty to keep current value.")
@@ -327,5 +505,5 @@ class InventorySystem:
 # ========== ENTRY POINT ==========
 
 if __name__ == "__main__":
-    system = InventorySystem(capacity=97)  # pick a starting size; resizing will handle growth
+    system = InventorySystem()  # dict-backed store; benchmark_search sizes its own comparison table
     system.run()
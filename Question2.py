@@ -1,45 +1,46 @@
 
 class DirectedGraph:
+    """Directed graph over dense integer vertex ids (0, 1, 2, ...)."""
     def __init__(self):
-        self.graph = {}
+        self.graph = []    # vertex id -> set of ids it has an edge to
+        self.reverse = []  # vertex id -> set of ids with an edge into it
 
     def addVertex(self, v):
-        if v not in self.graph:
-            self.graph[v] = set()
+        while len(self.graph) <= v:
+            self.graph.append(set())
+            self.reverse.append(set())
 
     def addEdge(self, src, dst):
-        if src not in self.graph:
-            self.addVertex(src)
-        if dst not in self.graph:
-            self.addVertex(dst)
+        self.addVertex(max(src, dst))
         self.graph[src].add(dst)
+        self.reverse[dst].add(src)
 
     def removeEdge(self, src, dst):
         """Remove directed edge src -> dst. Return True if removed, False otherwise."""
-        if src in self.graph and dst in self.graph[src]:
+        if self.hasEdge(src, dst):
             self.graph[src].remove(dst)
+            self.reverse[dst].discard(src)
             return True
         return False
 
     def listOutgoingAdjacentVertex(self, v):
-        return list(self.graph.get(v, []))
+        return list(self.graph[v]) if 0 <= v < len(self.graph) else []
 
     def listIncomingVertices(self, v):
-        result = []
-        for vertex, edges in self.graph.items():
-            if v in edges:
-                result.append(vertex)
-        return result
+        return list(self.reverse[v]) if 0 <= v < len(self.reverse) else []
 
     def listVertices(self):
-        return list(self.graph.keys())
+        return list(range(len(self.graph)))
 
     def hasEdge(self, src, dst):
-        return src in self.graph and dst in self.graph[src]
+        return 0 <= src < len(self.graph) and dst in self.graph[src]
 
 # Simple Person entity class
 class Person:
+    __slots__ = ('name', 'gender', 'biography', 'privacy', '_id')
+
     def __init__(self, name, gender, biography, privacy='public'):
+        self._id = None  # vertex id, assigned by SlowGramApp.add_person
         self.name = name
         self.gender = gender
         self.biography = biography
@@ -74,17 +75,18 @@ class SlowGramApp:
 
     # ---- Mandatory & Advanced methods ----
     def add_person(self, person):
-        """Add person object to list and graph as a vertex."""
+        """Add person object to list and graph as a vertex (its id is its list position)."""
+        person._id = len(self.people)
         self.people.append(person)
-        self.mygraph.addVertex(person)
+        self.mygraph.addVertex(person._id)
 
     def add_follow(self, follower, followed):
         """Create following edge follower -> followed."""
-        self.mygraph.addEdge(follower, followed)
+        self.mygraph.addEdge(follower._id, followed._id)
 
     def unfollow(self, follower, followed):
         """Remove following edge follower -> followed. Return bool."""
-        return self.mygraph.removeEdge(follower, followed)
+        return self.mygraph.removeEdge(follower._id, followed._id)
 
     # ---- Display / Query methods ----
     def display_all_profiles(self):
@@ -108,7 +110,7 @@ class SlowGramApp:
 
     def display_followers(self, index):
         person = self.people[index - 1]
-        followers = self.mygraph.listIncomingVertices(person)
+        followers = [self.people[i] for i in self.mygraph.listIncomingVertices(person._id)]
         print("\nFollower List:")
         if not followers:
             print("- No followers found.")
@@ -118,7 +120,7 @@ class SlowGramApp:
 
     def display_following(self, index):
         person = self.people[index - 1]
-        following = self.mygraph.listOutgoingAdjacentVertex(person)
+        following = [self.people[i] for i in self.mygraph.listOutgoingAdjacentVertex(person._id)]
         print("\nFollowing List:")
         if not following:
             print("- Not following anyone.")
@@ -168,7 +170,7 @@ class SlowGramApp:
             print("A user cannot follow themselves.")
             return
 
-        if self.mygraph.hasEdge(follower, followed):
+        if self.mygraph.hasEdge(follower._id, followed._id):
             print(f"{follower.getName()} is already following {followed.getName()}.")
             return
 
@@ -185,7 +187,7 @@ class SlowGramApp:
             print("Invalid selection. Cancelling.")
             return
 
-        following = self.mygraph.listOutgoingAdjacentVertex(follower)
+        following = [self.people[i] for i in self.mygraph.listOutgoingAdjacentVertex(follower._id)]
         if not following:
             print(f"{follower.getName()} is not following anyone.")
             return
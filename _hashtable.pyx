@@ -0,0 +1,211 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+#
+# Native version of HashTableRobinHood (Question1.py) for the lookup-heavy benchmark.
+# Build in place with:   cythonize -i _hashtable.pyx
+# Question1.py falls back to the pure-Python table when this module is not built.
+
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from cpython.object cimport PyObject, PyObject_Hash
+from cpython.pyport cimport PY_SSIZE_T_MAX
+from cpython.ref cimport Py_INCREF, Py_XDECREF
+from cpython.unicode cimport PyUnicode_Compare
+from sys import intern
+
+cdef double MAX_LOAD_FACTOR = 0.7
+
+
+cdef bint _is_prime(Py_ssize_t n):
+    cdef Py_ssize_t i = 3
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    while i * i <= n:
+        if n % i == 0:
+            return False
+        i += 2
+    return True
+
+
+cdef Py_ssize_t _next_prime(Py_ssize_t n):
+    while not _is_prime(n):
+        n += 1
+    return n
+
+
+cdef class CHashTable:
+    """
+    Robin Hood hash table keyed by str, with the same methods as HashTableRobinHood.
+    Slots are C arrays of owned PyObject* references plus cached hashes and probe distances.
+    Unlike the Python table, keys must be str: any other key type raises TypeError,
+    including in get/contains/delete, where HashTableRobinHood would report a miss.
+    """
+    cdef Py_hash_t* _hashes
+    cdef PyObject** _keys
+    cdef PyObject** _vals
+    cdef Py_ssize_t* _dib      # -1 marks an empty slot
+    cdef Py_ssize_t _capacity
+    cdef Py_ssize_t _size
+
+    def __cinit__(self, Py_ssize_t capacity=53):
+        self._capacity = 0
+        self._size = 0
+        self._resize(max(5, capacity))
+
+    def __dealloc__(self):
+        cdef Py_ssize_t i
+        if self._dib != NULL:
+            for i in range(self._capacity):
+                if self._dib[i] >= 0:
+                    Py_XDECREF(self._keys[i])
+                    Py_XDECREF(self._vals[i])
+        self._free(self._hashes, self._keys, self._vals, self._dib)
+
+    cdef void _free(self, Py_hash_t* hashes, PyObject** keys, PyObject** vals, Py_ssize_t* dib):
+        PyMem_Free(hashes)
+        PyMem_Free(keys)
+        PyMem_Free(vals)
+        PyMem_Free(dib)
+
+    cdef void _resize(self, Py_ssize_t new_capacity) except *:
+        cdef Py_ssize_t capacity = _next_prime(max(5, new_capacity))
+        cdef Py_hash_t* old_hashes = self._hashes
+        cdef PyObject** old_keys = self._keys
+        cdef PyObject** old_vals = self._vals
+        cdef Py_ssize_t* old_dib = self._dib
+        cdef Py_ssize_t old_capacity = self._capacity
+        cdef Py_ssize_t i
+        cdef Py_hash_t* hashes
+        cdef PyObject** keys
+        cdef PyObject** vals
+        cdef Py_ssize_t* dib
+        if <size_t> capacity > PY_SSIZE_T_MAX // sizeof(Py_ssize_t):
+            raise MemoryError()
+        # Allocate into locals so a failed allocation leaves the table untouched and usable.
+        hashes = <Py_hash_t*> PyMem_Malloc(capacity * sizeof(Py_hash_t))
+        keys = <PyObject**> PyMem_Malloc(capacity * sizeof(PyObject*))
+        vals = <PyObject**> PyMem_Malloc(capacity * sizeof(PyObject*))
+        dib = <Py_ssize_t*> PyMem_Malloc(capacity * sizeof(Py_ssize_t))
+        if not (hashes and keys and vals and dib):
+            self._free(hashes, keys, vals, dib)
+            raise MemoryError()
+        for i in range(capacity):
+            keys[i] = NULL
+            vals[i] = NULL
+            dib[i] = -1
+        self._hashes, self._keys, self._vals, self._dib = hashes, keys, vals, dib
+        self._capacity = capacity
+        # References move from the old arrays to the new ones; no refcount changes needed.
+        for i in range(old_capacity):
+            if old_dib[i] >= 0:
+                self._place(old_hashes[i], old_keys[i], old_vals[i])
+        self._free(old_hashes, old_keys, old_vals, old_dib)
+
+    cdef Py_ssize_t _find(self, str key, Py_hash_t h) except -2:
+        cdef Py_ssize_t idx = <Py_ssize_t> (<size_t> h % <size_t> self._capacity)
+        cdef Py_ssize_t dist = 0
+        cdef PyObject* k
+        while self._dib[idx] >= dist:
+            if self._hashes[idx] == h:
+                k = self._keys[idx]
+                if k == <PyObject*> key or PyUnicode_Compare(<object> k, key) == 0:
+                    return idx
+            dist += 1
+            idx += 1
+            if idx == self._capacity:
+                idx = 0
+        return -1
+
+    cdef void _place(self, Py_hash_t h, PyObject* key, PyObject* value):
+        """Robin Hood insertion of a key known to be absent; takes over both references."""
+        cdef Py_ssize_t idx = <Py_ssize_t> (<size_t> h % <size_t> self._capacity)
+        cdef Py_ssize_t dist = 0
+        cdef Py_hash_t th
+        cdef PyObject* tk
+        cdef PyObject* tv
+        cdef Py_ssize_t td
+        while self._dib[idx] >= 0:
+            if self._dib[idx] < dist:
+                th, tk, tv, td = self._hashes[idx], self._keys[idx], self._vals[idx], self._dib[idx]
+                self._hashes[idx], self._keys[idx], self._vals[idx], self._dib[idx] = h, key, value, dist
+                h, key, value, dist = th, tk, tv, td
+            dist += 1
+            idx += 1
+            if idx == self._capacity:
+                idx = 0
+        self._hashes[idx], self._keys[idx], self._vals[idx], self._dib[idx] = h, key, value, dist
+
+    def load_factor(self):
+        return self._size / self._capacity
+
+    def reserve(self, Py_ssize_t n_expected):
+        cdef Py_ssize_t needed = _next_prime(<Py_ssize_t> (n_expected / MAX_LOAD_FACTOR) + 1)
+        if needed > self._capacity:
+            self._resize(needed)
+
+    def insert(self, str key, value, bint allow_update=True):
+        key = intern(key)  # interned, so hits on the same SKU object skip PyUnicode_Compare
+        return self.insert_known_hash(key, PyObject_Hash(key), value, allow_update)
+
+    def insert_known_hash(self, str key, Py_hash_t key_hash, value, bint allow_update=True):
+        """insert() for callers that already hold hash(key) and an interned key."""
+        cdef Py_ssize_t slot
+        cdef PyObject* old
+        slot = self._find(key, key_hash)
+        if slot >= 0:
+            if not allow_update:
+                return False
+            old = self._vals[slot]
+            Py_INCREF(value)
+            self._vals[slot] = <PyObject*> value
+            Py_XDECREF(old)
+            return True
+        Py_INCREF(key)
+        Py_INCREF(value)
+        self._place(key_hash, <PyObject*> key, <PyObject*> value)
+        self._size += 1
+        if self._size > self._capacity * MAX_LOAD_FACTOR:
+            self._resize(self._capacity * 2 + 1)
+        return True
+
+    def get(self, str key):
+        cdef Py_ssize_t slot = self._find(key, PyObject_Hash(key))
+        if slot < 0:
+            return None
+        return <object> self._vals[slot]
+
+    def delete(self, str key):
+        cdef Py_ssize_t idx = self._find(key, PyObject_Hash(key))
+        cdef Py_ssize_t nxt
+        cdef PyObject* k
+        cdef PyObject* v
+        if idx < 0:
+            return False
+        k, v = self._keys[idx], self._vals[idx]
+        # Backward-shift deletion, as in HashTableRobinHood.delete.
+        nxt = idx + 1 if idx + 1 < self._capacity else 0
+        while self._dib[nxt] > 0:
+            self._hashes[idx], self._keys[idx], self._vals[idx] = self._hashes[nxt], self._keys[nxt], self._vals[nxt]
+            self._dib[idx] = self._dib[nxt] - 1
+            idx = nxt
+            nxt = idx + 1 if idx + 1 < self._capacity else 0
+        self._keys[idx], self._vals[idx], self._dib[idx] = NULL, NULL, -1
+        self._size -= 1
+        Py_XDECREF(k)
+        Py_XDECREF(v)
+        return True
+
+    def contains(self, str key):
+        return self._find(key, PyObject_Hash(key)) >= 0
+
+    def __len__(self):
+        return self._size
+
+    def items(self):
+        cdef Py_ssize_t i
+        # Snapshot first so the caller may mutate the table while iterating the result.
+        result = []
+        for i in range(self._capacity):
+            if self._dib[i] >= 0:
+                result.append((<object> self._keys[i], <object> self._vals[i]))
+        return iter(result)